@@ -11,6 +11,7 @@ setup(
         "markdown-it-py>=3.0.0",
         "mdurl>=0.1.2",
         "networkx>=3.4.2",
+        "orjson>=3.10.12",
         "pydantic>=2.10.4",
         "pydantic_core>=2.27.2",
         "Pygments>=2.18.0",
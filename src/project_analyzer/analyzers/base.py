@@ -1,26 +1,50 @@
 """
 Base analyzer class and common functionality
 """
+import os
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set
 
 from ..models import ProjectAnalysis
 
 
+# File and directory names that are skipped wherever they appear in a path
+IGNORE_NAMES = frozenset({
+    # Dirs
+    '__pycache__', 'node_modules', '.git', '.svn', '.hg',
+    'venv', 'env', '.env', '.venv', 'build', 'dist',
+    # Files
+    '.pyc', '.pyo', '.pyd', '.so', '.dll', '.dylib',
+    '.class', '.o', '.obj',
+    # Hidden
+    '.DS_Store', '.gitignore', '.gitattributes',
+})
+
 class BaseAnalyzer(ABC):
     """Base class for all analyzers"""
     
-    def __init__(self, root_path: str | Path):
+    def __init__(self, root_path: str | Path, file_list: Optional[List[Path]] = None):
         self.root_path = Path(root_path).resolve()
         if not self.root_path.exists():
             raise ValueError(f"Path does not exist: {root_path}")
+        # Files discovered by an earlier walk; skips our own traversal when set
+        self.file_list = file_list
         
     @abstractmethod
     def analyze(self) -> Dict[str, Any]:
         """Perform analysis and return results"""
         pass
     
+    def iter_files(self) -> Iterable[Path]:
+        """Iterate over non-ignored files, reusing the shared file list if given"""
+        if self.file_list is not None:
+            return self.file_list
+        return (
+            path for path in self.root_path.rglob('*')
+            if path.is_file() and not self.should_ignore(path)
+        )
+    
     def get_file_type(self, path: Path) -> str:
         """Determine file type/language from extension"""
         ext = path.suffix.lower()
@@ -63,23 +87,22 @@ class BaseAnalyzer(ABC):
     
     def should_ignore(self, path: Path) -> bool:
         """Check if file/directory should be ignored"""
-        ignore_patterns = {
-            # Dirs
-            '__pycache__', 'node_modules', '.git', '.svn', '.hg',
-            'venv', 'env', '.env', '.venv', 'build', 'dist',
-            # Files
-            '.pyc', '.pyo', '.pyd', '.so', '.dll', '.dylib',
-            '.class', '.o', '.obj',
-            # Hidden
-            '.DS_Store', '.gitignore', '.gitattributes',
-        }
-        
+        name = path.name
         return (
-            path.name in ignore_patterns or
-            path.name.startswith('.') or
-            any(p in path.parts for p in ignore_patterns)
+            name in IGNORE_NAMES or
+            name.startswith('.') or
+            not IGNORE_NAMES.isdisjoint(path.parts)
         )
     
+    def should_ignore_entry(self, entry: os.DirEntry) -> bool:
+        """Check if a directory entry should be ignored during a top-down walk
+        
+        Parent directories are assumed to have been checked already, so only
+        the entry's own name needs testing.
+        """
+        name = entry.name
+        return name in IGNORE_NAMES or name.startswith('.')
+    
     def get_file_encoding(self, path: Path) -> str:
         """Detect file encoding"""
         # TODO: Implement proper encoding detection
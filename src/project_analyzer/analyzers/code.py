@@ -2,6 +2,7 @@
 Code analyzer - Parses and analyzes source code to extract definitions and relationships
 """
 import ast
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple, Any, cast, Type
@@ -29,22 +30,19 @@ from .base import BaseAnalyzer
 class CodeAnalyzer(BaseAnalyzer):
     """Analyzes source code to extract definitions and relationships"""
     
-    def __init__(self, root_path: str | Path):
-        super().__init__(root_path)
+    def __init__(self, root_path: str | Path, file_list: Optional[List[Path]] = None):
+        super().__init__(root_path, file_list)
         self.dependency_graph = nx.DiGraph()
         self.current_file: Optional[str] = None
         self.current_class: Optional[str] = None
         self.current_function: Optional[str] = None
-        self.quality_analyzer = QualityAnalyzer(root_path)
+        self.quality_analyzer = QualityAnalyzer(root_path, file_list)
         
     def analyze(self) -> Dict[str, Any]:
         """Analyze all source code files in project"""
         files: Dict[str, File] = {}
         
-        for path in self.root_path.rglob('*'):
-            if not path.is_file() or self.should_ignore(path):
-                continue
-                
+        for path in self.iter_files():
             file_type = self.get_file_type(path)
             if file_type not in [
                 'python', 'javascript', 'typescript', 'react', 'react-typescript',
@@ -55,8 +53,8 @@ class CodeAnalyzer(BaseAnalyzer):
             try:
                 file_analysis = self.analyze_file(path)
                 if file_analysis:
-                    rel_path = str(path.relative_to(self.root_path))
-                    files[rel_path] = file_analysis
+                    # Key on the file's own interned path string
+                    files[file_analysis.path] = file_analysis
             except Exception as e:
                 print(f"Error analyzing {path}: {e}")
                 
@@ -111,7 +109,7 @@ class CodeAnalyzer(BaseAnalyzer):
             
         try:
             file_type = self.get_file_type(path)
-            rel_path = str(path.relative_to(self.root_path))
+            rel_path = sys.intern(str(path.relative_to(self.root_path)))
             
             file_analysis = File(
                 path=rel_path,
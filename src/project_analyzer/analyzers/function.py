@@ -16,17 +16,14 @@ from .base import BaseAnalyzer
 class FunctionAnalyzer(BaseAnalyzer):
     """Analyzes detailed function behavior and relationships"""
     
-    def __init__(self, root_path: str | Path):
-        super().__init__(root_path)
+    def __init__(self, root_path: str | Path, file_list: Optional[List[Path]] = None):
+        super().__init__(root_path, file_list)
         self.current_function: Optional[str] = None
         self.flows: Dict[str, FunctionBehavior] = {}
         
     def analyze(self) -> Dict[str, Any]:
         """Analyze all functions in project"""
-        for path in self.root_path.rglob('*'):
-            if not path.is_file() or self.should_ignore(path):
-                continue
-                
+        for path in self.iter_files():
             file_type = self.get_file_type(path)
             if file_type != 'python':  # Start with Python support
                 continue
@@ -74,6 +71,7 @@ class DetailedFunctionVisitor(ast.NodeVisitor):
     def visit_FunctionDef(self, node: ast.FunctionDef):
         """Analyze a function definition"""
         old_function = self.current_function
+        old_variables = self.current_variables
         self.current_function = node.name
         
         # Reset analysis state
@@ -97,11 +95,12 @@ class DetailedFunctionVisitor(ast.NodeVisitor):
         # Visit function body
         self.generic_visit(node)
         
-        # Create function flow
+        # Create function flow. State lists are snapshotted because an enclosing
+        # function keeps appending to them after a nested def returns.
         self.function_flows[node.name] = FunctionBehavior(
             entry_points=[],  # Filled in later by call analysis
             exit_points=self._find_exit_points(node),
-            return_paths=self.return_paths,
+            return_paths=list(self.return_paths),
             control_flow=[ControlFlow(
                 line_no=cf.line_no,
                 node_type=cf.node_type,
@@ -111,14 +110,18 @@ class DetailedFunctionVisitor(ast.NodeVisitor):
                 parent=cf.parent
             ) for cf in self.control_flow],
             pure=self.is_pure,
-            side_effects=self.side_effects,
+            side_effects=list(self.side_effects),
             raises=list(self.raises),
             async_status=isinstance(node, ast.AsyncFunctionDef),
             generators=any(isinstance(n, ast.Yield) for n in ast.walk(node)),
-            recursion=node.name in str(ast.dump(node))
+            recursion=node.name in str(ast.dump(node)),
+            variables=self.current_variables
         )
         
+        # Hand the enclosing function its own variable table back so a
+        # nested def doesn't swallow the rest of its reads and assignments
         self.current_function = old_function
+        self.current_variables = old_variables
         
     def visit_Name(self, node: ast.Name):
         """Track variable usage"""
@@ -1,9 +1,10 @@
 """
 Base language analyzer class
 """
+import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 from ...models import File, Function, Class, Variable, Import, CodeLocation
 
@@ -12,7 +13,10 @@ class LanguageAnalyzer(ABC):
     
     def __init__(self, file_path: Path, content: str):
         self.file_path = file_path
+        # Shared by every CodeLocation from this file instead of a fresh str each
+        self.file_str = sys.intern(str(file_path))
         self.content = content
+        self._locations: Dict[Tuple[int, int, Optional[int], Optional[int]], CodeLocation] = {}
         
     @abstractmethod
     def analyze(self) -> Dict[str, Any]:
@@ -24,6 +28,20 @@ class LanguageAnalyzer(ABC):
         """Get file dependencies"""
         pass
     
+    def make_location(self, line_start: int, line_end: int,
+                      column_start: Optional[int] = None,
+                      column_end: Optional[int] = None) -> CodeLocation:
+        """Get the shared CodeLocation for a span in this file
+        
+        Identical spans, such as each name of a multi-name import, resolve to
+        a single frozen instance instead of one copy per node.
+        """
+        key = (line_start, line_end, column_start, column_end)
+        location = self._locations.get(key)
+        if location is None:
+            location = self._locations[key] = CodeLocation(self.file_str, *key)
+        return location
+    
     def extract_docstring(self, content: str) -> Optional[str]:
         """Extract docstring/comments from code"""
         pass
@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 
 from .base import LanguageAnalyzer
-from ...models import Function, Class, Variable, Import, CodeLocation
+from ...models import Function, Class, Variable, Import
 
 class CppAnalyzer(LanguageAnalyzer):
     """Analyzer for C++ source files"""
@@ -89,8 +89,7 @@ class CppAnalyzer(LanguageAnalyzer):
             include = line.split('"')[1]
             return Import(
                 module=include,
-                location=CodeLocation(
-                    file=str(self.file_path),
+                location=self.make_location(
                     line_start=line_num,
                     line_end=line_num,
                     column_start=0,
@@ -158,8 +157,7 @@ class CppAnalyzer(LanguageAnalyzer):
                 name=full_name,
                 base_classes=inheritance,
                 docstring=f"{class_type.capitalize()} Template" if template_params else class_type.capitalize(),
-                location=CodeLocation(
-                    file=str(self.file_path),
+                location=self.make_location(
                     line_start=start,
                     line_end=i,
                     column_start=0,
@@ -188,7 +186,8 @@ class CppAnalyzer(LanguageAnalyzer):
             params_str = match.group(3)
             
             # Parse parameters
-            params = []
+            param_names = []
+            param_types = []
             if params_str.strip():
                 param_list = params_str.split(',')
                 for param in param_list:
@@ -199,10 +198,8 @@ class CppAnalyzer(LanguageAnalyzer):
                         if parts:
                             param_name = parts[-1].strip('&*')
                             param_type = ' '.join(parts[:-1])
-                            params.append({
-                                'name': param_name,
-                                'type': param_type
-                            })
+                            param_names.append(param_name)
+                            param_types.append(param_type)
                             
             # Find function end if it has body
             i = start
@@ -224,10 +221,10 @@ class CppAnalyzer(LanguageAnalyzer):
             
             return Function(
                 name=full_name,
-                args=params,
+                arg_names=tuple(param_names),
+                arg_types=tuple(param_types),
                 returns=return_type,
-                location=CodeLocation(
-                    file=str(self.file_path),
+                location=self.make_location(
                     line_start=start,
                     line_end=i,
                     column_start=0,
@@ -255,10 +252,9 @@ class CppAnalyzer(LanguageAnalyzer):
             
             return Variable(
                 name=name,
-                type=var_type,
+                type_hint=var_type,
                 value=value,
-                locations=[CodeLocation(
-                    file=str(self.file_path),
+                locations=[self.make_location(
                     line_start=line_num,
                     line_end=line_num,
                     column_start=0,
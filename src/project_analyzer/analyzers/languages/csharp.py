@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 
 from .base import LanguageAnalyzer
-from ...models import Function, Class, Variable, Import, CodeLocation
+from ...models import Function, Class, Variable, Import
 
 class CSharpAnalyzer(LanguageAnalyzer):
     """Analyzer for C# source files"""
@@ -90,8 +90,7 @@ class CSharpAnalyzer(LanguageAnalyzer):
                 return Import(
                     module=match.group(2),
                     alias=match.group(1),
-                    location=CodeLocation(
-                        file=str(self.file_path),
+                    location=self.make_location(
                         line_start=line_num,
                         line_end=line_num,
                         column_start=0,
@@ -103,8 +102,7 @@ class CSharpAnalyzer(LanguageAnalyzer):
             if match:
                 return Import(
                     module=match.group(1),
-                    location=CodeLocation(
-                        file=str(self.file_path),
+                    location=self.make_location(
                         line_start=line_num,
                         line_end=line_num,
                         column_start=0,
@@ -175,8 +173,7 @@ class CSharpAnalyzer(LanguageAnalyzer):
                 name=full_name,
                 base_classes=inheritance,
                 docstring=f"{type_kind.capitalize()}" + (f" with attributes: {', '.join(attributes)}" if attributes else ""),
-                location=CodeLocation(
-                    file=str(self.file_path),
+                location=self.make_location(
                     line_start=start,
                     line_end=i,
                     column_start=0,
@@ -212,7 +209,8 @@ class CSharpAnalyzer(LanguageAnalyzer):
             params_str = match.group(3)
             
             # Parse parameters
-            params = []
+            param_names = []
+            param_types = []
             if params_str.strip():
                 param_list = params_str.split(',')
                 for param in param_list:
@@ -222,10 +220,8 @@ class CSharpAnalyzer(LanguageAnalyzer):
                         param = re.sub(r'^(?:ref|out|in)\s+', '', param)
                         parts = param.split()
                         if len(parts) >= 2:
-                            params.append({
-                                'name': parts[-1],
-                                'type': ' '.join(parts[:-1])
-                            })
+                            param_names.append(parts[-1])
+                            param_types.append(' '.join(parts[:-1]))
                             
             # Find method end
             i = start
@@ -244,11 +240,11 @@ class CSharpAnalyzer(LanguageAnalyzer):
                     
             return Function(
                 name=name,
-                args=params,
+                arg_names=tuple(param_names),
+                arg_types=tuple(param_types),
                 returns=return_type,
                 docstring=f"Method with attributes: {', '.join(attributes)}" if attributes else None,
-                location=CodeLocation(
-                    file=str(self.file_path),
+                location=self.make_location(
                     line_start=start,
                     line_end=i,
                     column_start=0,
@@ -282,11 +278,10 @@ class CSharpAnalyzer(LanguageAnalyzer):
             
             return Variable(
                 name=name,
-                type=var_type,
+                type_hint=var_type,
                 value=value,
                 docstring=f"Member with attributes: {', '.join(attributes)}" if attributes else None,
-                locations=[CodeLocation(
-                    file=str(self.file_path),
+                locations=[self.make_location(
                     line_start=line_num,
                     line_end=line_num,
                     column_start=0,
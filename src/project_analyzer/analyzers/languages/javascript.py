@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 
 from .base import LanguageAnalyzer
-from ...models import Function, Class, Variable, Import, CodeLocation
+from ...models import Function, Class, Variable, Import
 
 class JavaScriptAnalyzer(LanguageAnalyzer):
     """Analyzer for JavaScript and TypeScript files"""
@@ -139,17 +139,15 @@ class JavaScriptAnalyzer(LanguageAnalyzer):
             if match:
                 name = match.group(1)
                 params = [p.strip() for p in match.group(2).split(',') if p.strip()]
+                arg_names = tuple(p.split('=')[0].strip() for p in params)
                 
                 return Function(
                     name=name,
-                    args=[{
-                        'name': p.split('=')[0].strip(),
-                        'type': param_types.get(p.split('=')[0].strip(), {}).get('type')
-                    } for p in params],
+                    arg_names=arg_names,
+                    arg_types=tuple(param_types.get(n, {}).get('type') for n in arg_names),
                     returns=return_type['type'] if return_type else None,
                     docstring='\n'.join(description),
-                    location=CodeLocation(
-                        file=str(self.file_path),
+                    location=self.make_location(
                         line_start=0,  # TODO: Track actual line numbers
                         line_end=0,
                         column_start=0,
@@ -165,8 +163,7 @@ class JavaScriptAnalyzer(LanguageAnalyzer):
                     name=match.group(1),
                     base_classes=[match.group(2)] if match.group(2) else [],
                     docstring='\n'.join(description),
-                    location=CodeLocation(
-                        file=str(self.file_path),
+                    location=self.make_location(
                         line_start=0,
                         line_end=0,
                         column_start=0,
@@ -197,8 +194,7 @@ class JavaScriptAnalyzer(LanguageAnalyzer):
                 return Import(
                     module=module,
                     names=names,
-                    location=CodeLocation(
-                        file=str(self.file_path),
+                    location=self.make_location(
                         line_start=0,
                         line_end=0,
                         column_start=0,
@@ -213,8 +209,7 @@ class JavaScriptAnalyzer(LanguageAnalyzer):
                 return Import(
                     module=match.group(2),
                     names=[match.group(1)],
-                    location=CodeLocation(
-                        file=str(self.file_path),
+                    location=self.make_location(
                         line_start=0,
                         line_end=0,
                         column_start=0,
@@ -236,8 +231,7 @@ class JavaScriptAnalyzer(LanguageAnalyzer):
                     name=match.group(1),
                     base_classes=[match.group(2)] if match.group(2) else [],
                     docstring="TypeScript Interface",
-                    location=CodeLocation(
-                        file=str(self.file_path),
+                    location=self.make_location(
                         line_start=start,
                         line_end=start,
                         column_start=0,
@@ -252,8 +246,7 @@ class JavaScriptAnalyzer(LanguageAnalyzer):
                     name=match.group(1),
                     base_classes=[],
                     docstring="TypeScript Type Alias",
-                    location=CodeLocation(
-                        file=str(self.file_path),
+                    location=self.make_location(
                         line_start=start,
                         line_end=start,
                         column_start=0,
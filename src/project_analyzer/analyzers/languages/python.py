@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 
 from .base import LanguageAnalyzer
-from ...models import Function, Class, Variable, Import, CodeLocation
+from ...models import Function, Class, Variable, Import
 
 class PythonAnalyzer(LanguageAnalyzer):
     """Analyzer for Python source files"""
@@ -85,8 +85,7 @@ class PythonAnalyzer(LanguageAnalyzer):
             imports.append(Import(
                 module=name.name,
                 alias=name.asname,
-                location=CodeLocation(
-                    file=str(self.file_path),
+                location=self.make_location(
                     line_start=node.lineno,
                     line_end=node.lineno,
                     column_start=node.col_offset,
@@ -104,8 +103,7 @@ class PythonAnalyzer(LanguageAnalyzer):
                 module=module,
                 names=[name.name],
                 alias=name.asname,
-                location=CodeLocation(
-                    file=str(self.file_path),
+                location=self.make_location(
                     line_start=node.lineno,
                     line_end=node.lineno,
                     column_start=node.col_offset,
@@ -118,7 +116,8 @@ class PythonAnalyzer(LanguageAnalyzer):
         
     def _handle_function(self, node: ast.FunctionDef) -> Function:
         """Handle FunctionDef nodes"""
-        args = []
+        arg_names = []
+        arg_types = []
         for arg in node.args.args:
             arg_type = None
             if arg.annotation:
@@ -126,7 +125,8 @@ class PythonAnalyzer(LanguageAnalyzer):
                     arg_type = ast.unparse(arg.annotation)
                 except (AttributeError, ValueError):
                     arg_type = None
-            args.append({"name": arg.arg, "type": arg_type})
+            arg_names.append(arg.arg)
+            arg_types.append(arg_type)
             
         returns = None
         if node.returns:
@@ -137,14 +137,14 @@ class PythonAnalyzer(LanguageAnalyzer):
                 
         return Function(
             name=node.name,
-            location=CodeLocation(
-                file=str(self.file_path),
+            location=self.make_location(
                 line_start=node.lineno,
                 line_end=node.end_lineno,
                 column_start=node.col_offset,
                 column_end=node.end_col_offset
             ),
-            args=args,
+            arg_names=tuple(arg_names),
+            arg_types=tuple(arg_types),
             returns=returns,
             docstring=ast.get_docstring(node),
             decorators=[ast.unparse(d) for d in node.decorator_list]
@@ -171,8 +171,7 @@ class PythonAnalyzer(LanguageAnalyzer):
         
         return Class(
             name=node.name,
-            location=CodeLocation(
-                file=str(self.file_path),
+            location=self.make_location(
                 line_start=node.lineno,
                 line_end=node.end_lineno,
                 column_start=node.col_offset,
@@ -192,8 +191,7 @@ class PythonAnalyzer(LanguageAnalyzer):
                 return Variable(
                     name=target.id,
                     value=ast.unparse(node.value),
-                    locations=[CodeLocation(
-                        file=str(self.file_path),
+                    locations=[self.make_location(
                         line_start=node.lineno,
                         line_end=node.end_lineno,
                         column_start=node.col_offset,
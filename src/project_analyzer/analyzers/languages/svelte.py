@@ -123,22 +123,26 @@ class SvelteAnalyzer(LanguageAnalyzer):
         
     def _adjust_locations(self, analysis: Dict[str, List[Any]], offset: int):
         """Adjust CodeLocation line numbers by offset"""
+        # Locations are shared and immutable, so swap in shifted ones
+        def shift(loc: CodeLocation) -> CodeLocation:
+            return self.make_location(
+                line_start=loc.line_start + offset,
+                line_end=loc.line_end + offset,
+                column_start=loc.column_start,
+                column_end=loc.column_end
+            )
+            
         for item in analysis.get("functions", []):
-            item.location.line_start += offset
-            item.location.line_end += offset
+            item.location = shift(item.location)
             
         for item in analysis.get("classes", []):
-            item.location.line_start += offset
-            item.location.line_end += offset
+            item.location = shift(item.location)
             
         for item in analysis.get("variables", []):
-            for loc in item.locations:
-                loc.line_start += offset
-                loc.line_end += offset
+            item.locations = [shift(loc) for loc in item.locations]
                 
         for item in analysis.get("imports", []):
-            item.location.line_start += offset
-            item.location.line_end += offset
+            item.location = shift(item.location)
             
     def _analyze_template(self, content: str, start_line: int) -> Dict[str, List[Any]]:
         """Analyze Svelte template syntax"""
@@ -156,8 +160,7 @@ class SvelteAnalyzer(LanguageAnalyzer):
                 functions.append(Function(
                     name=f"on_{event_name}",
                     docstring=f"Event handler for {event_name}",
-                    location=CodeLocation(
-                        file=str(self.file_path),
+                    location=self.make_location(
                         line_start=start_line + i,
                         line_end=start_line + i,
                         column_start=handler_match.start(),
@@ -172,8 +175,7 @@ class SvelteAnalyzer(LanguageAnalyzer):
                     variables.append(Variable(
                         name=reactive_match.group(1),
                         docstring="Reactive declaration",
-                        locations=[CodeLocation(
-                            file=str(self.file_path),
+                        locations=[self.make_location(
                             line_start=start_line + i,
                             line_end=start_line + i,
                             column_start=0,
@@ -188,8 +190,7 @@ class SvelteAnalyzer(LanguageAnalyzer):
                 variables.append(Variable(
                     name=each_match.group(1),
                     docstring="Each block iterable",
-                    locations=[CodeLocation(
-                        file=str(self.file_path),
+                    locations=[self.make_location(
                         line_start=start_line + i,
                         line_end=start_line + i,
                         column_start=0,
@@ -3,7 +3,7 @@ Quality analyzer - Analyzes code quality metrics like complexity and maintainabi
 """
 import ast
 from pathlib import Path
-from typing import Dict, Set, Any, List
+from typing import Dict, Set, Any, List, Optional
 
 from .base import BaseAnalyzer
 from .patterns import DesignPatternDetector
@@ -14,8 +14,8 @@ from ..models import File, Function
 class QualityAnalyzer(BaseAnalyzer):
     """Analyzes code quality metrics"""
     
-    def __init__(self, root_path: str | Path):
-        super().__init__(root_path)
+    def __init__(self, root_path: str | Path, file_list: Optional[List[Path]] = None):
+        super().__init__(root_path, file_list)
         self.function_calls: Dict[str, Set[str]] = {}  # caller -> callee
         self.pattern_detector = DesignPatternDetector()
         self.smell_detector = CodeSmellDetector()
@@ -25,10 +25,7 @@ class QualityAnalyzer(BaseAnalyzer):
     def analyze(self) -> Dict[str, Any]:
         """Analyze code quality metrics for all files"""
         
-        for path in self.root_path.rglob('*'):
-            if not path.is_file() or self.should_ignore(path):
-                continue
-                
+        for path in self.iter_files():
             file_type = self.get_file_type(path)
             if file_type not in ['python', 'javascript', 'typescript', 'c++', 'c#', 'svelte']:
                 continue
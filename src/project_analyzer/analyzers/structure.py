@@ -1,7 +1,9 @@
 """
 File structure analyzer - Analyzes project directory structure and file metadata
 """
+import os
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 
@@ -9,6 +11,10 @@ from ..models import ProjectStructure, File
 from .base import BaseAnalyzer
 
 
+# Sort key for os.DirEntry objects; the name is a cached plain string
+_entry_name = attrgetter('name')
+
+
 class StructureAnalyzer(BaseAnalyzer):
     """Analyzes project structure and generates file metadata"""
     
@@ -17,11 +23,18 @@ class StructureAnalyzer(BaseAnalyzer):
         self.total_files = 0
         self.total_size = 0
         self.languages: Dict[str, int] = {}
+        self.files: List[Path] = []  # All non-ignored files, in walk order
+        self._files_by_type: Optional[Dict[str, List[Path]]] = None
         
     def analyze(self) -> Dict[str, any]:
         """Analyze project structure and return results"""
+        self.files = []
+        self._files_by_type = {}
         structure = self._analyze_path(self.root_path)
         
+        # Language statistics fall out of the per-type file lists
+        self.languages = {lang: len(paths) for lang, paths in self._files_by_type.items()}
+        
         return {
             "structure": structure,
             "total_files": self.total_files,
@@ -34,7 +47,10 @@ class StructureAnalyzer(BaseAnalyzer):
         if self.should_ignore(path):
             return None
             
-        is_dir = path.is_dir()
+        return self._analyze_node(path, path.is_dir())
+    
+    def _analyze_node(self, path: Path, is_dir: bool) -> ProjectStructure:
+        """Recursively analyze a directory or file that passed the ignore check"""
         name = path.name or path.anchor
         
         # Get file/dir metadata
@@ -46,21 +62,17 @@ class StructureAnalyzer(BaseAnalyzer):
             size = None
             modified = None
             
-        structure = ProjectStructure(
-            name=name,
-            path=str(path.relative_to(self.root_path)),
-            is_dir=is_dir,
-            size_bytes=size,
-            last_modified=modified
-        )
-        
+        children: List[ProjectStructure] = []
         if is_dir:
             # Recursively process directory contents
             try:
-                for child in sorted(path.iterdir()):
-                    child_structure = self._analyze_path(child)
-                    if child_structure:
-                        structure.children.append(child_structure)
+                with os.scandir(path) as it:
+                    entries = list(it)
+                entries.sort(key=_entry_name)
+                for entry in entries:
+                    if self.should_ignore_entry(entry):
+                        continue
+                    children.append(self._analyze_node(Path(entry.path), entry.is_dir()))
             except (OSError, PermissionError):
                 pass
                 
@@ -70,14 +82,27 @@ class StructureAnalyzer(BaseAnalyzer):
             if size:
                 self.total_size += size
                 
-            # Track language statistics
+            # Remember the file so later analyzers can skip their own walk
             lang = self.get_file_type(path)
-            self.languages[lang] = self.languages.get(lang, 0) + 1
+            self.files.append(path)
+            self._files_by_type.setdefault(lang, []).append(path)
             
-        return structure
+        # tuple() of an empty list is the shared empty tuple, so leaves
+        # don't each carry their own children container
+        return ProjectStructure(
+            name=name,
+            path=str(path.relative_to(self.root_path)),
+            is_dir=is_dir,
+            children=tuple(children),
+            size_bytes=size,
+            last_modified=modified
+        )
     
     def get_files_by_type(self, file_type: str) -> List[Path]:
         """Get all files of a specific type/language"""
+        if self._files_by_type is not None:
+            return list(self._files_by_type.get(file_type, []))
+            
         files: List[Path] = []
         
         def collect_files(path: Path):
@@ -113,9 +138,7 @@ class StructureAnalyzer(BaseAnalyzer):
             return None
             
     def find_entry_points(self) -> List[str]:
-        """Find likely project entry points"""
-        entry_points = []
-        
+        """Find likely project entry points among the files found by analyze()"""
         # Common entry point patterns
         patterns = {
             'python': ['main.py', 'app.py', 'run.py'],
@@ -126,16 +149,11 @@ class StructureAnalyzer(BaseAnalyzer):
             'rust': ['main.rs'],
         }
         
-        def check_entry_points(path: Path):
-            if path.is_file():
-                if path.name.lower() in [p.lower() for patterns in patterns.values() for p in patterns]:
-                    entry_points.append(str(path.relative_to(self.root_path)))
-            elif path.is_dir() and not self.should_ignore(path):
-                try:
-                    for child in path.iterdir():
-                        check_entry_points(child)
-                except (OSError, PermissionError):
-                    pass
-                    
-        check_entry_points(self.root_path)
-        return entry_points
+        names = {name.lower() for group in patterns.values() for name in group}
+        
+        # Reuse the structure walk's file list instead of walking again
+        return [
+            str(path.relative_to(self.root_path))
+            for path in self.files
+            if path.name.lower() in names
+        ]
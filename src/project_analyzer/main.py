@@ -1,11 +1,15 @@
 """
 Main analyzer class and GUI/CLI interface
 """
-import json
 from pathlib import Path
-from typing import Optional, Dict, Any
+from itertools import chain
+from dataclasses import replace
+from operator import attrgetter
+from typing import Optional, Dict, Any, Tuple, BinaryIO
 import sys
 
+import orjson
+from pydantic import TypeAdapter
 from rich.console import Console
 from rich.table import Table
 from rich.tree import Tree
@@ -15,16 +19,32 @@ from rich.syntax import Syntax
 from .models import (
     ProjectAnalysis, 
     ProjectStructure,
+    File,
     Function,
-    FunctionBehavior,
-    ControlFlow,
-    VariableFlow
+    FunctionBehavior
 )
 from .prompt_generator import PromptGenerator
 from .analyzers.structure import StructureAnalyzer
 from .analyzers.code import CodeAnalyzer
 from .analyzers.function import FunctionAnalyzer
-from .folder_selector import select_project
+
+
+# pydantic-core serializers for the top-level analysis fields, so each one is
+# encoded straight to JSON without an intermediate dict
+_FIELD_SERIALIZERS = {
+    name: TypeAdapter(field.annotation)
+    for name, field in ProjectAnalysis.model_fields.items()
+    if name != "files"
+}
+
+# Sort key for structure nodes; with reverse=True directories come first while
+# the stable sort keeps each group in name order
+_node_is_dir = attrgetter("is_dir")
+
+
+def _indent_json(data: bytes, level: int) -> bytes:
+    """Re-indent an indented JSON document for nesting ``level`` levels deep"""
+    return data.replace(b"\n", b"\n" + b"  " * level)
 
 
 class ProjectAnalyzer:
@@ -47,77 +67,32 @@ class ProjectAnalyzer:
         
         self.console.print(Panel.fit("📝 Analyzing source code...", style="blue"))
         
-        # Analyze source code and functions
-        code_analyzer = CodeAnalyzer(self.root_path)
+        # Analyze source code and functions, reusing the files found by the
+        # structure walk instead of re-walking the tree
+        code_analyzer = CodeAnalyzer(self.root_path, structure_analyzer.files)
         code_results = code_analyzer.analyze()
         
-        # Get quality metrics
-        quality_metrics = code_analyzer.quality_analyzer.analyze()
+        # Quality metrics were already computed by the code analyzer
+        quality_metrics = code_results["quality_metrics"]
         
         # Detailed function analysis
         self.console.print(Panel.fit("🔍 Analyzing function behavior...", style="blue"))
-        function_analyzer = FunctionAnalyzer(self.root_path)
+        function_analyzer = FunctionAnalyzer(
+            self.root_path,
+            structure_analyzer.get_files_by_type('python')
+        )
         function_results = function_analyzer.analyze()
         
         # Update function analysis results
+        flows = function_results["function_flows"]
         for file_path, file_analysis in code_results["files"].items():
             for func in file_analysis.functions:
-                flow_key = f"{file_path}::{func.name}"
-                if flow_key in function_results["function_flows"]:
-                    flow = function_results["function_flows"][flow_key]
-                    func.behavior = FunctionBehavior(
-                        entry_points=flow.entry_points,
-                        exit_points=flow.exit_points,
-                        return_paths=flow.return_paths,
-                        control_flow=[ControlFlow(**node.__dict__) for node in flow.control_flow],
-                        pure=flow.pure,
-                        side_effects=flow.side_effects,
-                        raises=flow.raises,
-                        async_status=flow.async_status,
-                        generators=flow.generators,
-                        recursion=flow.recursion
-                    )
-                    func.variable_flow = [
-                        VariableFlow(
-                            name=name,
-                            assignments=var.assignments,
-                            reads=var.reads,
-                            scope=var.scope,
-                            type_hints=var.type_hints,
-                            potential_values=var.potential_values or []
-                        )
-                        for name, var in flow.variables.items()
-                    ]
+                self._apply_flow(func, f"{file_path}::{func.name}", flows)
             
             # Update class methods
             for cls in file_analysis.classes:
                 for method in cls.methods:
-                    flow_key = f"{file_path}::{cls.name}.{method.name}"
-                    if flow_key in function_results["function_flows"]:
-                        flow = function_results["function_flows"][flow_key]
-                        method.behavior = FunctionBehavior(
-                            entry_points=flow.entry_points,
-                            exit_points=flow.exit_points,
-                            return_paths=flow.return_paths,
-                            control_flow=[ControlFlow(**node.__dict__) for node in flow.control_flow],
-                            pure=flow.pure,
-                            side_effects=flow.side_effects,
-                            raises=flow.raises,
-                            async_status=flow.async_status,
-                            generators=flow.generators,
-                            recursion=flow.recursion
-                        )
-                        method.variable_flow = [
-                            VariableFlow(
-                                name=name,
-                                assignments=var.assignments,
-                                reads=var.reads,
-                                scope=var.scope,
-                                type_hints=var.type_hints,
-                                potential_values=var.potential_values or []
-                            )
-                            for name, var in flow.variables.items()
-                        ]
+                    self._apply_flow(method, f"{file_path}::{cls.name}.{method.name}", flows)
         
         # Combine results
         analysis = ProjectAnalysis(
@@ -134,8 +109,27 @@ class ProjectAnalyzer:
         
         return analysis
         
+    def _apply_flow(self, func: Function, flow_key: str, flows: Dict[str, FunctionBehavior]):
+        """Copy analyzed behavior and variable flow onto a function or method"""
+        flow = flows.get(flow_key)
+        if flow is None:
+            return
+            
+        # Variables are kept once, in variable_flow; the attached behavior is a
+        # shallow copy without them so they are not serialized twice
+        func.behavior = replace(flow, variables={})
+        func.variable_flow = list(flow.variables.values())
+        
     def display_analysis(self, analysis: ProjectAnalysis):
         """Display analysis results in terminal"""
+        # Render everything into one buffer and write it out once
+        with self.console.capture() as capture:
+            self._print_analysis(analysis)
+        sys.stdout.write(capture.get())
+        sys.stdout.flush()
+        
+    def _print_analysis(self, analysis: ProjectAnalysis):
+        """Print analysis results to the console"""
         self.console.print("\n")
         
         # Project Overview
@@ -175,73 +169,78 @@ class ProjectAnalyzer:
             self.console.print("\n[bold blue]Function Analysis:[/bold blue]")
             
             for file_path, file_analysis in analysis.files.items():
-                if file_analysis.functions or file_analysis.classes:
-                    self.console.print(f"\n[bold]{file_path}[/bold]")
+                if not (file_analysis.functions or file_analysis.classes):
+                    continue
                     
-                    # Basic metrics
-                    metrics_table = Table(show_header=True, header_style="bold")
-                    metrics_table.add_column("Function")
-                    metrics_table.add_column("Complexity")
-                    metrics_table.add_column("Pure")
-                    metrics_table.add_column("Side Effects")
-                    metrics_table.add_column("Raises")
+                # Build all rows in one pass over functions and class methods
+                members = chain(
+                    ((func, "") for func in file_analysis.functions),
+                    ((method, f"{cls.name}.") for cls in file_analysis.classes for method in cls.methods)
+                )
+                rows = [self._function_rows(func, prefix) for func, prefix in members]
+                flow_rows = [flow_row for _, flow_row in rows if flow_row is not None]
+                
+                self.console.print(f"\n[bold]{file_path}[/bold]")
+                
+                # Basic metrics
+                metrics_table = Table(show_header=True, header_style="bold")
+                metrics_table.add_column("Function")
+                metrics_table.add_column("Complexity")
+                metrics_table.add_column("Pure")
+                metrics_table.add_column("Side Effects")
+                metrics_table.add_column("Raises")
+                for metrics_row, _ in rows:
+                    metrics_table.add_row(*metrics_row)
                     
-                    # Function flow
+                self.console.print("\n[bold]Metrics:[/bold]")
+                self.console.print(metrics_table)
+                
+                # Function flow, skipped when no function has behavior data
+                if flow_rows:
                     flow_table = Table(show_header=True, header_style="bold")
                     flow_table.add_column("Function")
                     flow_table.add_column("Entry Points")
                     flow_table.add_column("Exit Points")
                     flow_table.add_column("Variables")
                     flow_table.add_column("Control Flow")
-                    
-                    def add_function_to_tables(func: Function, prefix: str = ""):
-                        # Add to metrics table
-                        metrics_table.add_row(
-                            prefix + func.name,
-                            str(func.complexity or "N/A"),
-                            "✓" if func.behavior and func.behavior.pure else "✗",
-                            "\n".join(func.behavior.side_effects) if func.behavior else "N/A",
-                            ", ".join(func.behavior.raises) if func.behavior else "N/A"
-                        )
+                    for flow_row in flow_rows:
+                        flow_table.add_row(*flow_row)
                         
-                        # Add to flow table
-                        if func.behavior:
-                            var_info = []
-                            for v in func.variable_flow:
-                                scope = f"[blue]{v.scope}[/blue]"
-                                assigns = f"assigned:{len(v.assignments)}"
-                                reads = f"read:{len(v.reads)}"
-                                var_info.append(f"{v.name} ({scope} {assigns} {reads})")
-                            
-                            flow_info = []
-                            for cf in func.behavior.control_flow:
-                                if cf.condition:
-                                    flow_info.append(f"{cf.node_type}: {cf.condition}")
-                                else:
-                                    flow_info.append(cf.node_type)
-                            
-                            flow_table.add_row(
-                                prefix + func.name,
-                                "\n".join(func.behavior.entry_points) or "None",
-                                "\n".join(func.behavior.exit_points) or "None",
-                                "\n".join(var_info),
-                                "\n".join(flow_info)
-                            )
-                    
-                    # Add functions
-                    for func in file_analysis.functions:
-                        add_function_to_tables(func)
-                    
-                    # Add class methods
-                    for cls in file_analysis.classes:
-                        for method in cls.methods:
-                            add_function_to_tables(method, f"{cls.name}.")
-                    
-                    self.console.print("\n[bold]Metrics:[/bold]")
-                    self.console.print(metrics_table)
                     self.console.print("\n[bold]Flow Analysis:[/bold]")
                     self.console.print(flow_table)
             
+    @staticmethod
+    def _function_rows(func: Function, prefix: str = "") -> Tuple[Tuple[str, ...], Optional[Tuple[str, ...]]]:
+        """Build the metrics row and, if behavior is known, the flow row for a function"""
+        behavior = func.behavior
+        metrics_row = (
+            prefix + func.name,
+            str(func.complexity or "N/A"),
+            "✓" if behavior and behavior.pure else "✗",
+            "\n".join(behavior.side_effects) if behavior else "N/A",
+            ", ".join(behavior.raises) if behavior else "N/A"
+        )
+        
+        if not behavior:
+            return metrics_row, None
+            
+        var_info = [
+            f"{v.name} ([blue]{v.scope}[/blue] assigned:{len(v.assignments)} read:{len(v.reads)})"
+            for v in func.variable_flow
+        ]
+        flow_info = [
+            f"{cf.node_type}: {cf.condition}" if cf.condition else cf.node_type
+            for cf in behavior.control_flow
+        ]
+        flow_row = (
+            prefix + func.name,
+            "\n".join(behavior.entry_points) or "None",
+            "\n".join(behavior.exit_points) or "None",
+            "\n".join(var_info),
+            "\n".join(flow_info)
+        )
+        return metrics_row, flow_row
+            
     def _build_structure_tree(self, structure: ProjectStructure, tree: Optional[Tree] = None) -> Tree:
         """Build rich Tree from ProjectStructure"""
         if tree is None:
@@ -250,26 +249,58 @@ class ProjectAnalyzer:
                 guide_style="blue"
             )
         
-        for child in structure.children:
-            if child.is_dir:
-                branch = tree.add(
-                    f"[bold blue]{child.name}/[/bold blue]"
-                )
-                self._build_structure_tree(child, branch)
-            else:
-                tree.add(f"[green]{child.name}[/green]")
+        # Iterative walk; children are stored in name order, and the stable
+        # sort on is_dir lists directories before files at every level
+        stack = [(tree, structure.children)]
+        while stack:
+            node, children = stack.pop()
+            for child in sorted(children, key=_node_is_dir, reverse=True):
+                if child.is_dir:
+                    branch = node.add(f"[bold blue]{child.name}/[/bold blue]")
+                    stack.append((branch, child.children))
+                else:
+                    node.add(f"[green]{child.name}[/green]")
                 
         return tree
         
-    def save_analysis(self, analysis: ProjectAnalysis, output_path: str | Path):
-        """Save analysis results to JSON file"""
+    def save_analysis(self, analysis: ProjectAnalysis, output_path: str | Path,
+                      prompts: Optional[Dict[str, str]] = None):
+        """Save analysis results, and optionally the generated AI prompts, to JSON file"""
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w') as f:
-            json.dump(analysis.model_dump(), f, indent=2)
+        # Stream the per-file results one at a time so the whole analysis is
+        # never materialized as nested dicts
+        with open(output_path, 'wb') as f:
+            f.write(b"{")
+            for i, name in enumerate(ProjectAnalysis.model_fields):
+                f.write(b",\n  " if i else b"\n  ")
+                f.write(orjson.dumps(name) + b": ")
+                if name == "files":
+                    self._write_files_json(f, analysis.files)
+                else:
+                    value = _FIELD_SERIALIZERS[name].dump_json(getattr(analysis, name), indent=2)
+                    f.write(_indent_json(value, 1))
+            if prompts is not None:
+                f.write(b',\n  "ai_prompts": ')
+                f.write(_indent_json(orjson.dumps(prompts, option=orjson.OPT_INDENT_2), 1))
+            f.write(b"\n}")
             
         self.console.print(f"\n💾 Analysis saved to: {output_path}")
+        
+    @staticmethod
+    def _write_files_json(f: BinaryIO, files: Dict[str, File]):
+        """Write the files mapping as indented JSON, serializing one File at a time"""
+        if not files:
+            f.write(b"{}")
+            return
+            
+        f.write(b"{")
+        for i, (path, file_analysis) in enumerate(files.items()):
+            f.write(b",\n    " if i else b"\n    ")
+            f.write(orjson.dumps(path) + b": ")
+            f.write(_indent_json(file_analysis.model_dump_json(indent=2).encode('utf-8'), 2))
+        f.write(b"\n  }")
 
 
 def main():
@@ -279,10 +310,13 @@ def main():
     # Check if web interface is requested
     if "--web" in sys.argv:
         from .web_interface import run_web_interface
-        run_web_interface()
+        # A project path after --web skips the folder dialog
+        paths = [arg for arg in sys.argv[1:] if arg != "--web"]
+        run_web_interface(paths[0] if paths else None)
         return
     
     # Use GUI folder selector
+    from .folder_selector import select_project
     project_path, output_file = select_project()
     if project_path is None:
         console.print("[yellow]Analysis cancelled.[/yellow]")
@@ -300,17 +334,8 @@ def main():
         
         # Save results to file if specified
         if output_file:
-            # Add prompts to analysis results
-            results = analysis.model_dump()
-            results["ai_prompts"] = prompts
-            
-            output_path = Path(output_file)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(output_path, 'w') as f:
-                json.dump(results, f, indent=2)
-                
-            console.print(f"\n💾 Analysis saved to: {output_path}")
+            # Stream the analysis and prompts straight to disk
+            analyzer.save_analysis(analysis, output_file, prompts)
             
             # Print instructions for web interface
             console.print("\nTo view results in web interface, run:")
@@ -1,12 +1,16 @@
 """
 Data models for project analysis results
 """
-from typing import Dict, List, Optional, Set, Any
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Any, Tuple
 from pydantic import BaseModel, Field
 
 
-class CodeLocation(BaseModel):
-    """Represents a location in source code"""
+# The highest-cardinality records are slotted dataclasses rather than
+# BaseModels, so their __init__ is generated straight-line code
+@dataclass(slots=True, frozen=True)
+class CodeLocation:
+    """Represents a location in source code; immutable so it can be shared"""
     file: str
     line_start: int
     line_end: int
@@ -14,57 +18,62 @@ class CodeLocation(BaseModel):
     column_end: Optional[int] = None
 
 
-class Variable(BaseModel):
+@dataclass(slots=True)
+class Variable:
     """Variable definition and usage information"""
     name: str
     type_hint: Optional[str] = None
     value: Optional[str] = None
-    locations: List[CodeLocation] = Field(default_factory=list)
+    locations: List[CodeLocation] = field(default_factory=list)
     is_constant: bool = False
     scope: str = "module"  # module, class, function
     docstring: Optional[str] = None
 
 
-class ControlFlow(BaseModel):
+@dataclass(slots=True)
+class ControlFlow:
     """Control flow information for a function"""
     line_no: int
     node_type: str
     condition: Optional[str] = None
-    true_branch: List[int] = Field(default_factory=list)
-    false_branch: List[int] = Field(default_factory=list)
+    true_branch: List[int] = field(default_factory=list)
+    false_branch: List[int] = field(default_factory=list)
     parent: Optional[int] = None
 
 
-class VariableFlow(BaseModel):
+@dataclass(slots=True)
+class VariableFlow:
     """Variable usage and flow analysis"""
     name: str
-    assignments: List[int] = Field(default_factory=list)  # Assignment line numbers
-    reads: List[int] = Field(default_factory=list)  # Usage line numbers
+    assignments: List[int] = field(default_factory=list)  # Assignment line numbers
+    reads: List[int] = field(default_factory=list)  # Usage line numbers
     scope: str = "local"  # local, global, nonlocal, parameter
     type_hints: Optional[str] = None
-    potential_values: List[str] = Field(default_factory=list)
+    potential_values: List[str] = field(default_factory=list)
 
 
-class FunctionBehavior(BaseModel):
+@dataclass(slots=True)
+class FunctionBehavior:
     """Detailed function behavior analysis"""
-    entry_points: List[str] = Field(default_factory=list)  # Functions that call this
-    exit_points: List[str] = Field(default_factory=list)  # Functions called before return
-    return_paths: List[List[int]] = Field(default_factory=list)  # Paths to returns
-    control_flow: List[ControlFlow] = Field(default_factory=list)
+    entry_points: List[str] = field(default_factory=list)  # Functions that call this
+    exit_points: List[str] = field(default_factory=list)  # Functions called before return
+    return_paths: List[List[int]] = field(default_factory=list)  # Paths to returns
+    control_flow: List[ControlFlow] = field(default_factory=list)
     pure: bool = True  # No side effects
-    side_effects: List[str] = Field(default_factory=list)
-    raises: List[str] = Field(default_factory=list)  # Potential exceptions
+    side_effects: List[str] = field(default_factory=list)
+    raises: List[str] = field(default_factory=list)  # Potential exceptions
     async_status: bool = False
     generators: bool = False
     recursion: bool = False
-    variables: Dict[str, VariableFlow] = Field(default_factory=dict)  # Variable usage tracking
+    variables: Dict[str, VariableFlow] = field(default_factory=dict)  # Variable usage tracking
 
 
 class Function(BaseModel):
     """Function/method definition and metadata"""
     name: str
     location: CodeLocation
-    args: List[Dict[str, Optional[str]]] = Field(default_factory=list)  # name: type_hint
+    arg_names: Tuple[str, ...] = ()
+    arg_types: Tuple[Optional[str], ...] = ()  # Type hint per arg_names entry
     returns: Optional[str] = None
     docstring: Optional[str] = None
     decorators: List[str] = Field(default_factory=list)
@@ -123,7 +132,7 @@ class ProjectStructure(BaseModel):
     name: str
     path: str
     is_dir: bool = True
-    children: List["ProjectStructure"] = Field(default_factory=list)
+    children: Tuple["ProjectStructure", ...] = ()  # Shared empty default for leaves
     size_bytes: Optional[int] = None
     last_modified: Optional[str] = None
 
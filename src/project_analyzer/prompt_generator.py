@@ -1,8 +1,46 @@
 """
 Generates AI assistant prompts from project analysis results
 """
+import io
+from collections import Counter
+from dataclasses import dataclass
+from operator import attrgetter
 from typing import Dict, List
-from .models import ProjectAnalysis, File, Function, Class
+from .models import ProjectAnalysis, Function, Class
+
+
+# Common design patterns, in suggestion order, with the line suggested when
+# a project doesn't use them
+_PATTERN_SUGGESTIONS = (
+    ('Factory', "- Factory Pattern: For flexible object creation and encapsulating instantiation logic"),
+    ('Singleton', "- Singleton Pattern: For managing shared resources or global state"),
+    ('Observer', "- Observer Pattern: For implementing event handling and loose coupling"),
+    ('Strategy', "- Strategy Pattern: For making algorithms interchangeable and reducing conditional complexity"),
+    ('Decorator', "- Decorator Pattern: For adding behavior to objects dynamically"),
+)
+
+# Sort key for structure nodes; with reverse=True directories come first while
+# the stable sort keeps each group in name order
+_node_is_dir = attrgetter('is_dir')
+
+
+def _dirs_first(children):
+    """Structure children with directories before files, each group in name order"""
+    return sorted(children, key=_node_is_dir, reverse=True)
+
+
+@dataclass(slots=True)
+class _FileSections:
+    """Per-file prompt sections and flags gathered in one walk over the files"""
+    organization: str
+    dependencies: str
+    functions: List[str]
+    classes: List[str]
+    has_functions: bool
+    has_classes: bool
+    function_docs: bool
+    class_docs: bool
+
 
 class PromptGenerator:
     """Generates structured prompts from analysis results"""
@@ -12,30 +50,37 @@ class PromptGenerator:
         """Generate all prompts from analysis results"""
         prompts = {}
         
+        # The structure tree appears in both the overview and architecture
+        # prompts; format it once per call
+        structure = PromptGenerator._format_structure(analysis.structure, 0)
+        
         # Always include overview
-        prompts["project_overview"] = PromptGenerator._generate_overview_prompt(analysis)
+        prompts["project_overview"] = PromptGenerator._generate_overview_prompt(analysis, structure)
+        
+        # Per-file sections for every prompt come from one walk over the files
+        sections = PromptGenerator._walk_files(analysis)
+        has_functions = sections.has_functions
+        has_classes = sections.has_classes
         
         # Architecture section
-        arch_prompt = PromptGenerator._generate_architecture_prompt(analysis)
+        arch_prompt = PromptGenerator._generate_architecture_prompt(analysis, structure, sections)
         if arch_prompt.strip():  # Only include if not empty
             prompts["architecture"] = arch_prompt
             
         # Functions section if there are any functions
-        has_functions = any(file.functions for file in analysis.files.values())
         if has_functions:
-            prompts["functions"] = PromptGenerator._generate_functions_prompt(analysis)
+            prompts["functions"] = PromptGenerator._generate_functions_prompt(sections.functions)
             
         # Classes section if there are any classes
-        has_classes = any(file.classes for file in analysis.files.values())
         if has_classes:
-            prompts["classes"] = PromptGenerator._generate_classes_prompt(analysis)
+            prompts["classes"] = PromptGenerator._generate_classes_prompt(sections.classes)
             
         # Add design patterns section
-        if hasattr(analysis, 'patterns') and analysis.patterns:
+        if analysis.patterns:
             prompts["design_patterns"] = PromptGenerator._generate_patterns_prompt(analysis)
             
         # Add code smells section
-        if hasattr(analysis, 'smells') and analysis.smells:
+        if analysis.smells:
             prompts["code_smells"] = PromptGenerator._generate_smells_prompt(analysis)
             
         # Add suggestions section
@@ -44,19 +89,17 @@ class PromptGenerator:
         if not has_functions and not has_classes:
             suggestions.append("- This appears to be a non-code project or contains no analyzable source files")
         
-        if has_functions and not any(f.docstring for file in analysis.files.values() for f in file.functions):
+        if has_functions and not sections.function_docs:
             suggestions.append("- Consider adding docstrings to functions to improve code documentation")
             
-        if has_classes and not any(c.docstring for file in analysis.files.values() for c in file.classes):
+        if has_classes and not sections.class_docs:
             suggestions.append("- Consider adding docstrings to classes to improve code documentation")
             
         # Add suggestions based on code smells
         if analysis.smells:
-            smell_counts = {}
-            for file_smells in analysis.smells.values():
-                for smell in file_smells:
-                    smell_type = smell['type']
-                    smell_counts[smell_type] = smell_counts.get(smell_type, 0) + 1
+            smell_counts = Counter(
+                smell['type'] for file_smells in analysis.smells.values() for smell in file_smells
+            )
                     
             for smell_type, count in smell_counts.items():
                 if count > 3:  # Only suggest if it's a recurring issue
@@ -70,24 +113,14 @@ class PromptGenerator:
                         suggestions.append(f"- Methods with too many parameters ({count} instances found). Consider using parameter objects or builder pattern")
                         
         # Add suggestions based on missing design patterns
-        common_patterns = {'Factory', 'Singleton', 'Observer', 'Strategy', 'Decorator'}
-        found_patterns = set()
-        for patterns_list in analysis.patterns.values():
-            found_patterns.update(patterns_list)
-            
-        missing_patterns = common_patterns - found_patterns
+        found_patterns = set().union(*analysis.patterns.values())
+        missing_patterns = [
+            suggestion for pattern, suggestion in _PATTERN_SUGGESTIONS
+            if pattern not in found_patterns
+        ]
         if missing_patterns:
             suggestions.append("\nConsider implementing these design patterns where appropriate:")
-            if 'Factory' in missing_patterns:
-                suggestions.append("- Factory Pattern: For flexible object creation and encapsulating instantiation logic")
-            if 'Singleton' in missing_patterns:
-                suggestions.append("- Singleton Pattern: For managing shared resources or global state")
-            if 'Observer' in missing_patterns:
-                suggestions.append("- Observer Pattern: For implementing event handling and loose coupling")
-            if 'Strategy' in missing_patterns:
-                suggestions.append("- Strategy Pattern: For making algorithms interchangeable and reducing conditional complexity")
-            if 'Decorator' in missing_patterns:
-                suggestions.append("- Decorator Pattern: For adding behavior to objects dynamically")
+            suggestions.extend(missing_patterns)
             
         if suggestions:
             prompts["suggestions"] = "\n".join([
@@ -99,7 +132,71 @@ class PromptGenerator:
         return prompts
 
     @staticmethod
-    def _generate_overview_prompt(analysis: ProjectAnalysis) -> str:
+    def _walk_files(analysis: ProjectAnalysis) -> _FileSections:
+        """Build every per-file prompt section in a single pass over the files"""
+        organization = io.StringIO()
+        dependencies = io.StringIO()
+        functions: List[str] = []
+        classes: List[str] = []
+        function_docs = False
+        class_docs = False
+        # Bound once for the loop
+        format_function = PromptGenerator._format_function
+        format_class = PromptGenerator._format_class
+        
+        for file_path, file_data in analysis.files.items():
+            # Architecture: file organization
+            organization.write(f"\n\n{file_path}:")
+            if file_data.functions:
+                organization.write("\n  Functions:")
+                for func in file_data.functions:
+                    organization.write(f"\n    - {func.name}")
+            if file_data.classes:
+                organization.write("\n  Classes:")
+                for cls in file_data.classes:
+                    organization.write(f"\n    - {cls.name}")
+                    
+            # Architecture: dependencies and relationships
+            deps = file_data.dependencies
+            if deps:
+                dependencies.write(f"\n\n{file_path} depends on:")
+                for dep in deps:
+                    dependencies.write(f"\n  - {dep}")
+            dependents = file_data.dependents
+            if dependents:
+                dependencies.write(f"\n\n{file_path} is used by:")
+                for dep in dependents:
+                    dependencies.write(f"\n  - {dep}")
+                    
+            # Function and class analysis
+            if file_data.functions:
+                functions.append("\n".join([
+                    f"\nFile: {file_path}",
+                    *[format_function(func) for func in file_data.functions],
+                ]))
+                if not function_docs:
+                    function_docs = any(func.docstring for func in file_data.functions)
+            if file_data.classes:
+                classes.append("\n".join([
+                    f"\nFile: {file_path}",
+                    *[format_class(cls) for cls in file_data.classes],
+                ]))
+                if not class_docs:
+                    class_docs = any(cls.docstring for cls in file_data.classes)
+                    
+        return _FileSections(
+            organization=organization.getvalue(),
+            dependencies=dependencies.getvalue(),
+            functions=functions,
+            classes=classes,
+            has_functions=bool(functions),
+            has_classes=bool(classes),
+            function_docs=function_docs,
+            class_docs=class_docs,
+        )
+
+    @staticmethod
+    def _generate_overview_prompt(analysis: ProjectAnalysis, structure: str) -> str:
         """Generate project overview prompt"""
         languages = ", ".join(f"{lang} ({count} files)" 
                             for lang, count in analysis.languages.items())
@@ -114,157 +211,128 @@ Languages: {languages}
 Entry Points: {entry_points}
 
 Key Files:
-{PromptGenerator._format_structure(analysis.structure, 0)}
+{structure}
 """
 
     @staticmethod
-    def _generate_architecture_prompt(analysis: ProjectAnalysis) -> str:
+    def _generate_architecture_prompt(analysis: ProjectAnalysis, structure: str,
+                                     sections: _FileSections) -> str:
         """Generate architecture and dependencies prompt"""
-        sections = []
+        buf = io.StringIO()
         
         # Project structure
-        sections.append("Project Structure:")
-        sections.append("-----------------")
-        sections.append(PromptGenerator._format_structure(analysis.structure, 0))
+        buf.write("Project Structure:\n-----------------\n")
+        buf.write(structure)
         
         # Entry points
-        sections.append("\nEntry Points:")
-        sections.append("-----------------")
+        buf.write("\n\nEntry Points:\n-----------------")
         if analysis.entry_points:
             for entry in analysis.entry_points:
-                sections.append(f"- {entry}")
+                buf.write(f"\n- {entry}")
         else:
-            sections.append("No entry points identified")
+            buf.write("\nNo entry points identified")
             
-        # File organization
-        sections.append("\nFile Organization:")
-        sections.append("-----------------")
-        for file_path, file_data in analysis.files.items():
-            sections.append(f"\n{file_path}:")
-            if file_data.functions:
-                sections.append("  Functions:")
-                for func in file_data.functions:
-                    sections.append(f"    - {func.name}")
-            if file_data.classes:
-                sections.append("  Classes:")
-                for cls in file_data.classes:
-                    sections.append(f"    - {cls.name}")
-                    
-        # Dependencies
-        sections.append("\nDependencies and Relationships:")
-        sections.append("-----------------")
-        for file_path, file_data in analysis.files.items():
-            if hasattr(file_data, 'dependencies') and file_data.dependencies:
-                sections.append(f"\n{file_path} depends on:")
-                for dep in file_data.dependencies:
-                    sections.append(f"  - {dep}")
-            if hasattr(file_data, 'dependents') and file_data.dependents:
-                sections.append(f"\n{file_path} is used by:")
-                for dep in file_data.dependents:
-                    sections.append(f"  - {dep}")
-                    
-        return "\n".join(sections)
+        # File organization and dependencies, prepared by _walk_files
+        buf.write("\n\nFile Organization:\n-----------------")
+        buf.write(sections.organization)
+        buf.write("\n\nDependencies and Relationships:\n-----------------")
+        buf.write(sections.dependencies)
+        return buf.getvalue()
 
     @staticmethod
-    def _generate_functions_prompt(analysis: ProjectAnalysis) -> str:
+    def _generate_functions_prompt(functions: List[str]) -> str:
         """Generate functions analysis prompt"""
-        functions = []
-        
-        for file_path, file_data in analysis.files.items():
-            if file_data.functions:
-                functions.append(f"\nFile: {file_path}")
-                for func in file_data.functions:
-                    functions.append(PromptGenerator._format_function(func))
-                    
-        return f"""
-Function Analysis:
------------------
-{chr(10).join(functions)}
-"""
+        buf = io.StringIO()
+        buf.write("\nFunction Analysis:\n-----------------\n")
+        buf.write("\n".join(functions))
+        buf.write("\n")
+        return buf.getvalue()
 
     @staticmethod
-    def _generate_classes_prompt(analysis: ProjectAnalysis) -> str:
+    def _generate_classes_prompt(classes: List[str]) -> str:
         """Generate classes analysis prompt"""
-        classes = []
-        
-        for file_path, file_data in analysis.files.items():
-            if file_data.classes:
-                classes.append(f"\nFile: {file_path}")
-                for cls in file_data.classes:
-                    classes.append(PromptGenerator._format_class(cls))
-                    
-        return f"""
-Class Analysis:
---------------
-{chr(10).join(classes)}
-"""
+        buf = io.StringIO()
+        buf.write("\nClass Analysis:\n--------------\n")
+        buf.write("\n".join(classes))
+        buf.write("\n")
+        return buf.getvalue()
 
     @staticmethod
     def _generate_patterns_prompt(analysis: ProjectAnalysis) -> str:
         """Generate design patterns prompt"""
-        sections = ["Design Patterns:", "-----------------"]
+        buf = io.StringIO()
+        buf.write("Design Patterns:\n-----------------")
         
         if not analysis.patterns:
-            sections.append("\nNo design patterns detected in the codebase.")
-            sections.append("\nConsider implementing common design patterns like:")
-            sections.append("- Factory Pattern: For flexible object creation")
-            sections.append("- Singleton Pattern: For managing global state")
-            sections.append("- Observer Pattern: For event handling")
-            sections.append("- Strategy Pattern: For interchangeable algorithms")
-            sections.append("- Decorator Pattern: For adding behavior to objects dynamically")
-            return "\n".join(sections)
+            buf.write(
+                "\n\nNo design patterns detected in the codebase."
+                "\n\nConsider implementing common design patterns like:"
+                "\n- Factory Pattern: For flexible object creation"
+                "\n- Singleton Pattern: For managing global state"
+                "\n- Observer Pattern: For event handling"
+                "\n- Strategy Pattern: For interchangeable algorithms"
+                "\n- Decorator Pattern: For adding behavior to objects dynamically"
+            )
+            return buf.getvalue()
         
         for file_path, patterns in analysis.patterns.items():
             if patterns:
-                sections.append(f"\n{file_path}:")
+                buf.write(f"\n\n{file_path}:")
                 for pattern in patterns:
-                    sections.append(f"  - {pattern}")
+                    buf.write(f"\n  - {pattern}")
                     
-        return "\n".join(sections)
+        return buf.getvalue()
         
     @staticmethod
     def _generate_smells_prompt(analysis: ProjectAnalysis) -> str:
         """Generate code smells prompt"""
-        sections = ["Code Smells:", "-----------------"]
+        buf = io.StringIO()
+        buf.write("Code Smells:\n-----------------")
         
         if not analysis.smells:
-            sections.append("\nNo significant code smells detected in the codebase.")
-            sections.append("\nCommon code smells to watch out for:")
-            sections.append("- Long Methods: Keep methods focused and concise")
-            sections.append("- Large Classes: Split classes with too many responsibilities")
-            sections.append("- Deep Nesting: Avoid complex nested conditionals")
-            sections.append("- Too Many Parameters: Consider grouping related parameters")
-            return "\n".join(sections)
+            buf.write(
+                "\n\nNo significant code smells detected in the codebase."
+                "\n\nCommon code smells to watch out for:"
+                "\n- Long Methods: Keep methods focused and concise"
+                "\n- Large Classes: Split classes with too many responsibilities"
+                "\n- Deep Nesting: Avoid complex nested conditionals"
+                "\n- Too Many Parameters: Consider grouping related parameters"
+            )
+            return buf.getvalue()
         
         for file_path, smells in analysis.smells.items():
             if smells:
-                sections.append(f"\n{file_path}:")
+                buf.write(f"\n\n{file_path}:")
                 for smell in smells:
-                    sections.append(f"  - {smell['type']} at line {smell.get('line', 'N/A')}")
+                    buf.write(f"\n  - {smell['type']} at line {smell.get('line', 'N/A')}")
                     if 'message' in smell:
-                        sections.append(f"    {smell['message']}")
+                        buf.write(f"\n    {smell['message']}")
                     
-        return "\n".join(sections)
+        return buf.getvalue()
 
     @staticmethod
     def _format_structure(structure, level: int) -> str:
-        """Format project structure recursively"""
-        indent = "  " * level
-        output = [f"{indent}{structure.name}/"]
-        
-        for child in sorted(structure.children, key=lambda x: (not x.is_dir, x.name)):
-            if child.is_dir:
-                output.append(PromptGenerator._format_structure(child, level + 1))
+        """Format project structure as a string, walking it with an explicit stack"""
+        buf = io.StringIO()
+        buf.write(f"{'  ' * level}{structure.name}/")
+        # Children are stored in name order; list directories first, pushing
+        # them reversed so they pop in display order
+        stack = [(child, level + 1) for child in reversed(_dirs_first(structure.children))]
+        while stack:
+            node, depth = stack.pop()
+            indent = "  " * depth
+            if node.is_dir:
+                buf.write(f"\n{indent}{node.name}/")
+                stack.extend((child, depth + 1) for child in reversed(_dirs_first(node.children)))
             else:
-                output.append(f"{indent}  {child.name}")
-                
-        return "\n".join(output)
+                buf.write(f"\n{indent}{node.name}")
+        return buf.getvalue()
 
     @staticmethod
     def _format_function(func: Function) -> str:
         """Format function details"""
-        args = ", ".join(f"{arg['name']}: {arg['type']}" if arg['type'] 
-                        else arg['name'] for arg in func.args)
+        args = ", ".join(f"{name}: {arg_type}" if arg_type else name
+                         for name, arg_type in zip(func.arg_names, func.arg_types))
         
         details = [
             f"  {func.name}({args}) -> {func.returns or 'None'}",
@@ -314,8 +382,9 @@ Class Analysis:
                 
         if cls.methods:
             details.append("  Methods:")
+            format_function = PromptGenerator._format_function
             for method in cls.methods:
-                method_details = PromptGenerator._format_function(method)
+                method_details = format_function(method)
                 details.extend(f"    {line}" for line in method_details.split("\n"))
                 
         return "\n".join(details)
@@ -1,11 +1,117 @@
 """Web interface for displaying analysis prompts"""
-from flask import Flask, render_template_string
+import gzip
+import hashlib
+import logging
+import sys
+from dataclasses import dataclass
+from flask import Flask, Response, abort, render_template, request
 from pathlib import Path
+from typing import Optional
 from .main import ProjectAnalyzer
-from .folder_selector import select_project
 from .prompt_generator import PromptGenerator
 
 app = Flask(__name__)
+logger = logging.getLogger(__name__)
+
+# Page styles, served from /app.css so browsers cache them across reloads
+STYLESHEET = """
+body {
+    font-family: system-ui, -apple-system, sans-serif;
+    line-height: 1.5;
+    margin: 0;
+    padding: 20px;
+    background: #1e1e1e;
+    color: #d4d4d4;
+}
+.container {
+    max-width: 1200px;
+    margin: 0 auto;
+    background: #252526;
+    padding: 20px;
+    border-radius: 8px;
+    box-shadow: 0 4px 6px rgba(0,0,0,0.2);
+}
+.tabs {
+    display: flex;
+    gap: 2px;
+    margin-bottom: 20px;
+    background: #2d2d2d;
+    padding: 5px;
+    border-radius: 6px;
+}
+.tab {
+    padding: 10px 20px;
+    cursor: pointer;
+    border: none;
+    background: none;
+    border-radius: 4px;
+    font-size: 14px;
+    color: #d4d4d4;
+    transition: all 0.2s;
+}
+.tab.active {
+    background: #3c3c3c;
+    font-weight: 500;
+    color: #fff;
+}
+.tab:hover:not(.active) {
+    background: #3c3c3c50;
+}
+.content {
+    display: none;
+    white-space: pre-wrap;
+    font-family: 'JetBrains Mono', 'Consolas', monospace;
+    background: #1e1e1e;
+    padding: 20px;
+    border-radius: 8px;
+    border: 1px solid #333;
+    font-size: 14px;
+    line-height: 1.6;
+    overflow-x: auto;
+    color: #d4d4d4;
+}
+.content.active {
+    display: block;
+}
+h1 {
+    margin-top: 0;
+    margin-bottom: 20px;
+    font-size: 24px;
+    font-weight: 500;
+    color: #fff;
+}
+.project-name {
+    color: #888;
+    font-size: 16px;
+    margin-bottom: 20px;
+    padding-bottom: 20px;
+    border-bottom: 1px solid #333;
+}
+.section-title {
+    color: #569cd6;
+    font-weight: 500;
+    margin-bottom: 10px;
+}
+.section-divider {
+    border-top: 1px solid #333;
+    margin: 20px 0;
+}
+.function-name {
+    color: #dcdcaa;
+}
+.class-name {
+    color: #4ec9b0;
+}
+.file-path {
+    color: #ce9178;
+}
+.keyword {
+    color: #569cd6;
+}
+.comment {
+    color: #6a9955;
+}
+"""
 
 HTML_TEMPLATE = """
 <!DOCTYPE html>
@@ -14,163 +120,182 @@ HTML_TEMPLATE = """
     <title>Project Analysis Prompts</title>
     <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/styles/github-dark.min.css">
     <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/highlight.min.js"></script>
-    <style>
-        body {
-            font-family: system-ui, -apple-system, sans-serif;
-            line-height: 1.5;
-            margin: 0;
-            padding: 20px;
-            background: #1e1e1e;
-            color: #d4d4d4;
-        }
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-            background: #252526;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.2);
-        }
-        .tabs {
-            display: flex;
-            gap: 2px;
-            margin-bottom: 20px;
-            background: #2d2d2d;
-            padding: 5px;
-            border-radius: 6px;
-        }
-        .tab {
-            padding: 10px 20px;
-            cursor: pointer;
-            border: none;
-            background: none;
-            border-radius: 4px;
-            font-size: 14px;
-            color: #d4d4d4;
-            transition: all 0.2s;
-        }
-        .tab.active {
-            background: #3c3c3c;
-            font-weight: 500;
-            color: #fff;
-        }
-        .tab:hover:not(.active) {
-            background: #3c3c3c50;
-        }
-        .content {
-            display: none;
-            white-space: pre-wrap;
-            font-family: 'JetBrains Mono', 'Consolas', monospace;
-            background: #1e1e1e;
-            padding: 20px;
-            border-radius: 8px;
-            border: 1px solid #333;
-            font-size: 14px;
-            line-height: 1.6;
-            overflow-x: auto;
-            color: #d4d4d4;
-        }
-        .content.active {
-            display: block;
-        }
-        h1 {
-            margin-top: 0;
-            margin-bottom: 20px;
-            font-size: 24px;
-            font-weight: 500;
-            color: #fff;
-        }
-        .project-name {
-            color: #888;
-            font-size: 16px;
-            margin-bottom: 20px;
-            padding-bottom: 20px;
-            border-bottom: 1px solid #333;
-        }
-        .section-title {
-            color: #569cd6;
-            font-weight: 500;
-            margin-bottom: 10px;
-        }
-        .section-divider {
-            border-top: 1px solid #333;
-            margin: 20px 0;
-        }
-        .function-name {
-            color: #dcdcaa;
-        }
-        .class-name {
-            color: #4ec9b0;
-        }
-        .file-path {
-            color: #ce9178;
-        }
-        .keyword {
-            color: #569cd6;
-        }
-        .comment {
-            color: #6a9955;
-        }
-    </style>
+    <link rel="stylesheet" href="/app.css?v={{ css_version }}">
 </head>
 <body>
     <div class="container">
         <h1>Project Analysis Prompts</h1>
         <div class="project-name">Analyzing: {{ project_name }}</div>
         <div class="tabs">
-            <button class="tab active" data-tab="project_overview">Project Overview</button>
-            <button class="tab" data-tab="architecture">Architecture</button>
-            <button class="tab" data-tab="functions">Functions</button>
-            <button class="tab" data-tab="classes">Classes</button>
-            <button class="tab" data-tab="design_patterns">Design Patterns</button>
-            <button class="tab" data-tab="code_smells">Code Smells</button>
-            <button class="tab" data-tab="suggestions">Suggestions</button>
+            {%- for category, label in tabs %}
+            <button class="tab {% if loop.first %}active{% endif %}" data-tab="{{ category }}">{{ label }}</button>
+            {%- endfor %}
         </div>
-        {% for category, content in prompts.items() %}
-        <pre class="content {% if loop.first %}active{% endif %}" id="{{ category }}"><code class="language-markdown">{{ content }}</code></pre>
-        {% endfor %}
+        {#- The first prompt is rendered into the page so it shows without
+            JavaScript; the rest are fetched when their tab is first opened #}
+        {%- for category, label in tabs %}
+        {%- if loop.first %}
+        <pre class="content active" id="{{ category }}"><code class="language-markdown">{{ first_prompt }}</code></pre>
+        {%- else %}
+        <pre class="content" id="{{ category }}" data-src="/prompt/{{ category }}"><code class="language-markdown"></code></pre>
+        {%- endif %}
+        {%- endfor %}
     </div>
     <script>
+        // Tabs and content panes, looked up once when the page loads
+        let contents = [];
+        let tabs = [];
+        const contentById = new Map();
+        const tabByCategory = new Map();
+        
         document.addEventListener('DOMContentLoaded', function() {
-            // Add click handlers to all tabs
-            document.querySelectorAll('.tab').forEach(tab => {
-                tab.addEventListener('click', () => {
-                    const category = tab.getAttribute('data-tab');
-                    showContent(category);
-                });
+            contents = document.querySelectorAll('.content');
+            tabs = document.querySelectorAll('.tab');
+            contents.forEach(content => contentById.set(content.id, content));
+            
+            tabs.forEach(tab => tabByCategory.set(tab.dataset.tab, tab));
+            
+            // One delegated click handler for the whole tab bar
+            document.querySelector('.tabs').addEventListener('click', event => {
+                const tab = event.target.closest('.tab');
+                if (tab) {
+                    showContent(tab.dataset.tab);
+                }
             });
             
-            // Initialize syntax highlighting
-            hljs.highlightAll();
+            // The initially active prompt is already in the page
+            if (contents.length) {
+                highlight(contents[0].querySelector('code'));
+            }
         });
         
         function showContent(category) {
             // Hide all content
-            document.querySelectorAll('.content').forEach(content => {
+            contents.forEach(content => {
                 content.classList.remove('active');
             });
             
             // Remove active from all tabs
-            document.querySelectorAll('.tab').forEach(tab => {
+            tabs.forEach(tab => {
                 tab.classList.remove('active');
             });
             
             // Show selected content and activate tab
-            document.getElementById(category).classList.add('active');
-            document.querySelector(`[data-tab="${category}"]`).classList.add('active');
+            const content = contentById.get(category);
+            content.classList.add('active');
+            tabByCategory.get(category).classList.add('active');
+            
+            // Fetch the prompt the first time its tab is opened; data-src is
+            // only dropped once it has loaded, so a failed fetch is retried
+            if (content.dataset.src && !content.dataset.loading) {
+                const code = content.querySelector('code');
+                content.dataset.loading = 'true';
+                fetch(content.dataset.src)
+                    .then(response => {
+                        if (!response.ok) {
+                            throw new Error(`${response.status} ${response.statusText}`);
+                        }
+                        return response.text();
+                    })
+                    .then(text => {
+                        delete content.dataset.src;
+                        code.textContent = text;
+                        highlight(code);
+                    })
+                    .catch(error => {
+                        console.error(`Failed to load ${category} prompt:`, error);
+                        code.textContent = `Failed to load prompt (${error.message}). Reopen the tab to retry.`;
+                    })
+                    .finally(() => {
+                        delete content.dataset.loading;
+                    });
+            }
+        }
+        
+        // Highlighting is cosmetic: skip it when the highlight.js script did
+        // not load, and never let it turn a loaded prompt into a load error
+        function highlight(code) {
+            if (!window.hljs) {
+                return;
+            }
+            try {
+                hljs.highlightElement(code);
+            } catch (error) {
+                console.warn('Syntax highlighting failed:', error);
+            }
         }
     </script>
 </body>
 </html>
 """
 
-def run_web_interface():
-    """Run the web interface"""
-    # Get project path from GUI
-    project_path, _ = select_project()
-    if project_path is None:
-        print("Analysis cancelled.")
-        return
+def _compact(source: str) -> str:
+    """Strip indentation and blank lines from embedded HTML, CSS or JS source"""
+    return "\n".join(line.strip() for line in source.splitlines() if line.strip())
+
+
+# Compacted and compiled once at import; render_template_string would
+# re-parse and re-compile the source on every request
+_TEMPLATE = app.jinja_env.from_string(_compact(HTML_TEMPLATE))
+
+# Bodies at least this large also keep a gzip-compressed copy
+_COMPRESS_MIN_SIZE = 1024
+
+
+@dataclass(slots=True)
+class _CachedBody:
+    """A response body encoded once, with its gzip variant and ETag"""
+    data: bytes
+    gzipped: Optional[bytes]
+    etag: str
+    
+    @classmethod
+    def from_text(cls, text: str) -> "_CachedBody":
+        data = text.encode('utf-8')
+        gzipped = gzip.compress(data) if len(data) >= _COMPRESS_MIN_SIZE else None
+        return cls(data, gzipped, hashlib.sha1(data).hexdigest())
+
+
+def _cached_response(cached: _CachedBody, mimetype: str, immutable: bool = False) -> Response:
+    """Serve a cached body, gzip-encoded when the client accepts it"""
+    if cached.gzipped is not None and request.accept_encodings['gzip']:
+        response = Response(cached.gzipped, mimetype=mimetype)
+        response.headers['Content-Encoding'] = 'gzip'
+        response.set_etag(f"{cached.etag}-gzip")
+    else:
+        response = Response(cached.data, mimetype=mimetype)
+        response.set_etag(cached.etag)
+    response.vary.add('Accept-Encoding')
+    if immutable:
+        # Only for versioned URLs whose content never changes
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+        response.cache_control.max_age = 31536000
+    else:
+        response.cache_control.private = True
+        response.cache_control.max_age = 60
+    return response.make_conditional(request)
+
+
+_STYLESHEET = _CachedBody.from_text(_compact(STYLESHEET))
+
+
+@app.route('/app.css')
+def stylesheet():
+    # The page links this with ?v=<etag>, so a changed stylesheet gets a new URL
+    return _cached_response(_STYLESHEET, 'text/css', immutable=True)
+
+def run_web_interface(path: Optional[str | Path] = None):
+    """Run the web interface, asking for the project folder unless a path is given"""
+    if path is None:
+        # Get project path from GUI; Tk is only loaded when it's needed
+        from .folder_selector import select_project
+        project_path, _ = select_project()
+        if project_path is None:
+            print("Analysis cancelled.")
+            return
+    else:
+        project_path = Path(path)
     
     try:
         # Analyze project
@@ -180,27 +305,56 @@ def run_web_interface():
         # Generate prompts
         prompts = PromptGenerator.generate_prompts(analysis)
         
-        # Debug print
-        print("\nGenerated prompts:")
-        for category, content in prompts.items():
-            print(f"\n{category}:")
-            print("-" * 40)
-            print(content)
-            print("-" * 40)
+        # Prompt contents are only dumped when debug logging is enabled
+        logger.debug("Generated prompts: %s", list(prompts))
+        if logger.isEnabledFor(logging.DEBUG):
+            for category, content in prompts.items():
+                logger.debug("%s:\n%s", category, content)
         
-        # Define route
-        @app.route('/')
-        def index():
-            return render_template_string(HTML_TEMPLATE, 
-                                       prompts=prompts,
-                                       project_name=analysis.name)
+        # (category, label) per generated prompt, shared by the tab and pane loops
+        tabs = [(category, category.replace('_', ' ').title()) for category in prompts]
+        
+        # Prompts don't change once generated, so render the page once and
+        # encode and compress every body up front. The page inlines only the
+        # first prompt; every prompt is also served from /prompt/<name>
+        with app.app_context():
+            page = _CachedBody.from_text(render_template(_TEMPLATE,
+                                                         tabs=tabs,
+                                                         first_prompt=next(iter(prompts.values()), ''),
+                                                         css_version=_STYLESHEET.etag[:12],
+                                                         project_name=analysis.name))
+        prompt_bodies = {
+            name: _CachedBody.from_text(content)
+            for name, content in prompts.items()
+        }
+        
+        # Define routes; the cached bodies are bound as defaults so each
+        # request reads locals instead of closure cells
+        def index(page=page):
+            return _cached_response(page, 'text/html')
+            
+        def prompt(name, prompt_bodies=prompt_bodies):
+            cached = prompt_bodies.get(name)
+            if cached is None:
+                abort(404)
+            return _cached_response(cached, 'text/plain')
+            
+        app.add_url_rule('/', 'index', index)
+        app.add_url_rule('/prompt/<name>', 'prompt', prompt)
         
-        # Run Flask app
+        # Serve with waitress when it is installed; otherwise fall back to
+        # Flask's server, threaded so the lazily fetched prompt tabs are
+        # served concurrently, without the debug reloader's extra process
         print("\nStarting web interface...")
-        app.run(host='0.0.0.0', port=5001)
+        try:
+            from waitress import serve
+        except ImportError:
+            app.run(host='0.0.0.0', port=5001, threaded=True, debug=False, use_reloader=False)
+        else:
+            serve(app, host='0.0.0.0', port=5001, threads=8)
         
     except Exception as e:
         print(f"Error running web interface: {str(e)}")
 
 if __name__ == '__main__':
-    run_web_interface()
+    run_web_interface(sys.argv[1] if len(sys.argv) > 1 else None)